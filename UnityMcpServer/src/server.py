@@ -7,17 +7,20 @@ It implements the Model Context Protocol (MCP) to expose Unity functionality to
 
 import os
 import sys
-import json
 import logging
+import socket
 import asyncio
+import itertools
 import traceback
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, List, Optional, Set, Tuple, Union, Callable
 from enum import Enum
 
+import msgspec
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from starlette.websockets import WebSocketState
 
 # Configure logging
 logging.basicConfig(
@@ -39,85 +42,160 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# asyncio.timeout() (Python 3.11+) arms a timer on the running task rather than
+# going through wait_for(); 3.10 keeps using wait_for()
+if sys.version_info >= (3, 11):
+    async def wait_with_timeout(future: asyncio.Future, timeout: float) -> Any:
+        async with asyncio.timeout(timeout):
+            return await future
+else:
+    wait_with_timeout = asyncio.wait_for
+
+# A raw JSON message as received from a WebSocket, text or binary
+Frame = Union[str, bytes]
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.unity_connection: Optional[WebSocket] = None
-        self.pending_requests: Dict[str, asyncio.Future] = {}
+        # Every request to Unity goes out under a server-assigned id, so ids
+        # chosen by MCP clients can never collide with each other or with ours
+        self.pending_requests: Dict[int, asyncio.Future] = {}
+        self._id_counter = itertools.count(1)
+        # Frames bound for Unity are queued and sent by a single writer task
+        self._outbox: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         
-    async def connect(self, websocket: WebSocket, client_type: str):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+    def connect(self, websocket: WebSocket, client_type: str):
+        self.active_connections.add(websocket)
         if client_type == "unity":
+            self._stop_writer()
             self.unity_connection = websocket
+            self._outbox = asyncio.Queue(maxsize=1024)
+            self._writer_task = asyncio.create_task(self._write_to_unity(websocket, self._outbox))
             logger.info("Unity Editor connected")
         else:
             logger.info(f"Client connected: {client_type}")
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        if websocket == self.unity_connection:
+        self.active_connections.discard(websocket)
+        if websocket is self.unity_connection:
+            self._stop_writer()
             self.unity_connection = None
+            # Requests already sent will never be answered on this connection
+            for future in list(self.pending_requests.values()):
+                if not future.done():
+                    future.set_exception(Exception("Unity Editor disconnected"))
             logger.info("Unity Editor disconnected")
         else:
             logger.info("Client disconnected")
     
-    async def send_to_unity(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.unity_connection:
+    async def _write_to_unity(self, websocket: WebSocket, outbox: asyncio.Queue):
+        """Send queued frames to Unity, one WebSocket message per frame"""
+        while True:
+            frame, future = await outbox.get()
+            if future.done():
+                # The caller has already timed out or gone away
+                continue
+            try:
+                await send_frame(websocket, frame)
+            except asyncio.CancelledError:
+                # Stopped mid-send; this frame has already left the queue
+                if not future.done():
+                    future.set_exception(Exception("Unity Editor disconnected"))
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+    
+    def _stop_writer(self):
+        """Stop the writer task and fail the requests it had not sent yet"""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._outbox is not None:
+            while not self._outbox.empty():
+                _, future = self._outbox.get_nowait()
+                if not future.done():
+                    future.set_exception(Exception("Unity Editor disconnected"))
+            self._outbox = None
+    
+    async def send_to_unity(self, message: Dict[str, Any]) -> Frame:
+        """Send an MCP client's message to Unity and return the response with the client's id"""
+        request_id = next(self._id_counter)
+        frame, response = await self._request(request_id, orjson.dumps({**message, "id": request_id}))
+        if "id" not in message:
+            return frame
+        response["id"] = message["id"]
+        response_frame = orjson.dumps(response)
+        # Reply with the same frame type Unity used
+        return response_frame.decode() if isinstance(frame, str) else response_frame
+    
+    async def forward_to_unity(self, function_name: str, params: bytes) -> Frame:
+        """Send a call whose params are already JSON-encoded, without decoding them"""
+        request_id = next(self._id_counter)
+        frame = b'{"id":%d,"function":"%s","params":%s}' % (
+            request_id, function_name.encode(), params)
+        response_frame, _ = await self._request(request_id, frame)
+        return response_frame
+    
+    async def _request(self, request_id: int, frame: Frame) -> Tuple[Frame, Dict[str, Any]]:
+        """Send a frame to Unity and wait for the response, raw and decoded"""
+        # Don't send into a socket that is already known to be closed
+        unity = self.unity_connection
+        if unity is None or unity.client_state != WebSocketState.CONNECTED:
             raise Exception("No Unity connection available")
         
-        request_id = message.get("id", str(id(message)))
-        message["id"] = request_id
-        
         # Create a future to wait for the response
-        future = asyncio.Future()
+        future = asyncio.get_running_loop().create_future()
         self.pending_requests[request_id] = future
         
-        # Send the message to Unity
-        await self.unity_connection.send_json(message)
-        
         try:
-            # Wait for the response with a timeout
-            response = await asyncio.wait_for(future, timeout=30.0)
-            return response
+            # Hand the frame to the writer task
+            try:
+                self._outbox.put_nowait((frame, future))
+            except asyncio.QueueFull:
+                raise Exception("Too many requests queued for Unity")
+            
+            # Wait for the response frame with a timeout
+            return await wait_with_timeout(future, 30.0)
         except asyncio.TimeoutError:
-            del self.pending_requests[request_id]
             raise Exception("Request to Unity timed out")
+        finally:
+            # Drop the entry on success, timeout or a failed send alike
+            self.pending_requests.pop(request_id, None)
     
-    def handle_unity_response(self, response: Dict[str, Any]):
+    def handle_unity_response(self, frame: Frame):
+        # The response is decoded once here; callers get both the raw frame
+        # and the decoded message
+        response = orjson.loads(frame)
         request_id = response.get("id")
-        if request_id in self.pending_requests:
-            future = self.pending_requests.pop(request_id)
-            if not future.done():
-                future.set_result(response)
-        else:
+        future = self.pending_requests.pop(request_id, None)
+        if future is None and isinstance(request_id, str) and request_id.isdecimal():
+            # Older bridges echo numeric ids back as strings
+            future = self.pending_requests.pop(int(request_id), None)
+        if future is None:
             logger.warning(f"Received response for unknown request ID: {request_id}")
+        elif not future.done():
+            future.set_result((frame, response))
 
 # Initialize connection manager
 manager = ConnectionManager()
 
 # MCP Models
-class ResourceListRequest(BaseModel):
-    cursor: Optional[str] = None
-
-class ResourceListResponse(BaseModel):
-    resources: List[Dict[str, Any]]
-    cursor: Optional[str] = None
-
-class ResourceReadRequest(BaseModel):
+class ResourceReadRequest(msgspec.Struct):
     uri: str
 
-class ResourceReadResponse(BaseModel):
-    content: Any
-
 # MCP Function Models
-class ExecuteMenuItemRequest(BaseModel):
+# Request bodies are validated against these with msgspec and then forwarded
+# to Unity unchanged; the bridge applies the same defaults.
+class ExecuteMenuItemRequest(msgspec.Struct):
     menu_path: str
     action: str = "execute"
     parameters: Optional[Dict[str, Any]] = None
 
-class ManageScriptRequest(BaseModel):
+class ManageScriptRequest(msgspec.Struct):
     action: str  # 'create', 'read', 'update', 'delete'
     name: str
     path: Optional[str] = "Assets/"
@@ -125,20 +203,20 @@ class ManageScriptRequest(BaseModel):
     script_type: Optional[str] = None
     namespace: Optional[str] = None
 
-class ManageEditorRequest(BaseModel):
+class ManageEditorRequest(msgspec.Struct):
     action: str  # 'play', 'pause', 'get_state', 'set_active_tool', etc.
     wait_for_completion: Optional[bool] = None
     tool_name: Optional[str] = None
     tag_name: Optional[str] = None
     layer_name: Optional[str] = None
 
-class ManageSceneRequest(BaseModel):
+class ManageSceneRequest(msgspec.Struct):
     action: str  # 'load', 'save', 'create', 'get_hierarchy', etc.
     name: Optional[str] = None
     path: Optional[str] = "Assets/"
     build_index: Optional[int] = None
 
-class ManageAssetRequest(BaseModel):
+class ManageAssetRequest(msgspec.Struct):
     action: str  # 'import', 'create', 'modify', 'delete', 'duplicate', etc.
     path: str
     asset_type: Optional[str] = None
@@ -151,7 +229,7 @@ class ManageAssetRequest(BaseModel):
     page_size: Optional[int] = None
     generate_preview: Optional[bool] = False
 
-class ManageGameObjectRequest(BaseModel):
+class ManageGameObjectRequest(msgspec.Struct):
     action: str  # 'create', 'modify', 'find', 'add_component', etc.
     target: Optional[str] = None
     search_method: Optional[str] = None
@@ -176,7 +254,7 @@ class ManageGameObjectRequest(BaseModel):
     save_as_prefab: Optional[bool] = False
     prefab_folder: Optional[str] = "Assets/Prefabs"
 
-class ReadConsoleRequest(BaseModel):
+class ReadConsoleRequest(msgspec.Struct):
     action: str  # 'get' or 'clear'
     types: Optional[List[str]] = None  # 'error', 'warning', 'log', 'all'
     count: Optional[int] = None
@@ -185,12 +263,45 @@ class ReadConsoleRequest(BaseModel):
     format: Optional[str] = None  # 'plain', 'detailed', 'json'
     include_stacktrace: Optional[bool] = None
 
-# MCP Function Response
-class FunctionResponse(BaseModel):
-    success: bool
-    message: Optional[str] = None
-    data: Optional[Any] = None
-    error: Optional[str] = None
+# Request model for each MCP function, keyed by the Unity function name
+ROUTES = {
+    "execute_menu_item": ExecuteMenuItemRequest,
+    "manage_script": ManageScriptRequest,
+    "manage_editor": ManageEditorRequest,
+    "manage_scene": ManageSceneRequest,
+    "manage_asset": ManageAssetRequest,
+    "manage_gameobject": ManageGameObjectRequest,
+    "read_console": ReadConsoleRequest,
+}
+
+# MCP Resources
+# Tool descriptions published by /list
+_DESCRIPTIONS = {
+    "execute_menu_item": "Executes a Unity Editor menu item via its path (e.g., \"File/Save Project\").\n\n        Args:\n            ctx: The MCP context.\n            menu_path: The full path of the menu item to execute.\n            action: The operation to perform (default: 'execute').\n            parameters: Optional parameters for the menu item (rarely used).\n\n        Returns:\n            A dictionary indicating success or failure, with optional message/error.\n        ",
+    "manage_script": "Manages C# scripts in Unity (create, read, update, delete).\n        Make reference variables public for easier access in the Unity Editor.\n\n        Args:\n            action: Operation ('create', 'read', 'update', 'delete').\n            name: Script name (no .cs extension).\n            path: Asset path (default: \"Assets/\").\n            contents: C# code for 'create'/'update'.\n            script_type: Type hint (e.g., 'MonoBehaviour').\n            namespace: Script namespace.\n\n        Returns:\n            Dictionary with results ('success', 'message', 'data').\n        ",
+    "manage_editor": "Controls and queries the Unity editor's state and settings.\n\n        Args:\n            action: Operation (e.g., 'play', 'pause', 'get_state', 'set_active_tool', 'add_tag').\n            wait_for_completion: Optional. If True, waits for certain actions.\n            Action-specific arguments (e.g., tool_name, tag_name, layer_name).\n\n        Returns:\n            Dictionary with operation results ('success', 'message', 'data').\n        ",
+    "manage_scene": "Manages Unity scenes (load, save, create, get hierarchy, etc.).\n\n        Args:\n            action: Operation (e.g., 'load', 'save', 'create', 'get_hierarchy').\n            name: Scene name (no extension) for create/load/save.\n            path: Asset path for scene operations (default: \"Assets/\").\n            build_index: Build index for load/build settings actions.\n            # Add other action-specific args as needed (e.g., for hierarchy depth)\n\n        Returns:\n            Dictionary with results ('success', 'message', 'data').\n        ",
+    "manage_asset": "Performs asset operations (import, create, modify, delete, etc.) in Unity.\n\n        Args:\n            ctx: The MCP context.\n            action: Operation to perform (e.g., 'import', 'create', 'modify', 'delete', 'duplicate', 'move', 'rename', 'search', 'get_info', 'create_folder', 'get_components').\n            path: Asset path (e.g., \"Materials/MyMaterial.mat\") or search scope.\n            asset_type: Asset type (e.g., 'Material', 'Folder') - required for 'create'.\n            properties: Dictionary of properties for 'create'/'modify'.\n            destination: Target path for 'duplicate'/'move'.\n            search_pattern: Search pattern (e.g., '*.prefab').\n            filter_*: Filters for search (type, date).\n            page_*: Pagination for search.\n\n        Returns:\n            A dictionary with operation results ('success', 'data', 'error').\n        ",
+    "manage_gameobject": "Manages GameObjects: create, modify, delete, find, and component operations.\n\n        Args:\n            action: Operation (e.g., 'create', 'modify', 'find', 'add_component', 'remove_component', 'set_component_property').\n            target: GameObject identifier (name or path string) for modify/delete/component actions.\n            search_method: How to find objects ('by_name', 'by_id', 'by_path', etc.). Used with 'find' and some 'target' lookups.\n            name: GameObject name - used for both 'create' (initial name) and 'modify' (rename).\n            tag: Tag name - used for both 'create' (initial tag) and 'modify' (change tag).\n            parent: Parent GameObject reference - used for both 'create' (initial parent) and 'modify' (change parent).\n            layer: Layer name - used for both 'create' (initial layer) and 'modify' (change layer).\n            component_properties: Dict mapping Component names to their properties to set.\n                                  Example: {\"Rigidbody\": {\"mass\": 10.0, \"useGravity\": True}},\n                                  To set references:\n                                  - Use asset path string for Prefabs/Materials, e.g., {\"MeshRenderer\": {\"material\": \"Assets/Materials/MyMat.mat\"}}\n                                  - Use a dict for scene objects/components, e.g.:\n                                    {\"MyScript\": {\"otherObject\": {\"find\": \"Player\", \"method\": \"by_name\"}}} (assigns GameObject)\n                                    {\"MyScript\": {\"playerHealth\": {\"find\": \"Player\", \"component\": \"HealthComponent\"}}} (assigns Component)\n                                  Example set nested property:\n                                  - Access shared material: {\"MeshRenderer\": {\"sharedMaterial.color\": [1, 0, 0, 1]}}\n            components_to_add: List of component names to add.\n            Action-specific arguments (e.g., position, rotation, scale for create/modify;\n                     component_name for component actions;\n                     search_term, find_all for 'find').\n\n        Returns:\n            Dictionary with operation results ('success', 'message', 'data').\n        ",
+    "read_console": "Gets messages from or clears the Unity Editor console.\n\n        Args:\n            ctx: The MCP context.\n            action: Operation ('get' or 'clear').\n            types: Message types to get ('error', 'warning', 'log', 'all').\n            count: Max messages to return.\n            filter_text: Text filter for messages.\n            since_timestamp: Get messages after this timestamp (ISO 8601).\n            format: Output format ('plain', 'detailed', 'json').\n            include_stacktrace: Include stack traces in output.\n\n        Returns:\n            Dictionary with results. For 'get', includes 'data' (messages).\n        ",
+}
+
+# Parameter schemas are generated from the request models in one pass, so
+# they always match what the endpoints validate against
+_, _SCHEMA_COMPONENTS = msgspec.json.schema_components(ROUTES.values())
+_SCHEMAS = {name: _SCHEMA_COMPONENTS[model.__name__] for name, model in ROUTES.items()}
+
+RESOURCES = [
+    {"uri": uri, "description": _DESCRIPTIONS[uri], "schema": _SCHEMAS[uri]}
+    for uri in ROUTES
+]
+
+def _encode_read_response(uri: str) -> bytes:
+    return orjson.dumps({"content": {"message": f"Schema for {uri}"}})
+
+# The resource list is constant, so it is serialized once at import
+_LIST_BYTES = orjson.dumps({"resources": RESOURCES, "cursor": None})
+_READ_BYTES = {resource["uri"]: _encode_read_response(resource["uri"]) for resource in RESOURCES}
 
 # MCP Routes
 @app.get("/")
@@ -198,233 +309,83 @@ async def root():
     print("\033[92m✓ Windsurf Unity MCP Server running at http://localhost:" + str(port) + "\033[0m")
     return {"message": "Windsurf Unity MCP Server is running"}
 
-@app.post("/list")
-async def list_resources(request: ResourceListRequest) -> ResourceListResponse:
+# /list, /read and the function endpoints are plain Starlette routes. They
+# return pre-encoded JSON or Unity's own response, so FastAPI's request and
+# response model handling would only add overhead.
+def decode_body(body: bytes, model: type) -> Any:
+    """Decode and validate a JSON request body against a msgspec model"""
+    try:
+        # Lax mode accepts stringified numbers and booleans such as "3" or
+        # "true", which LLM-driven clients often send and the bridge accepts
+        return msgspec.json.decode(body, type=model, strict=False)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def list_resources(request: Request) -> Response:
     """List available MCP resources (functions)"""
-    resources = [
-        {
-            "uri": "execute_menu_item",
-            "description": "Executes a Unity Editor menu item via its path (e.g., \"File/Save Project\").\n\n        Args:\n            ctx: The MCP context.\n            menu_path: The full path of the menu item to execute.\n            action: The operation to perform (default: 'execute').\n            parameters: Optional parameters for the menu item (rarely used).\n\n        Returns:\n            A dictionary indicating success or failure, with optional message/error.\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "menu_path": {"title": "Menu Path", "type": "string"},
-                    "action": {"title": "Action", "type": "string", "default": "execute"},
-                    "parameters": {"title": "Parameters", "type": "object"}
-                }
-            }
-        },
-        {
-            "uri": "manage_script",
-            "description": "Manages C# scripts in Unity (create, read, update, delete).\n        Make reference variables public for easier access in the Unity Editor.\n\n        Args:\n            action: Operation ('create', 'read', 'update', 'delete').\n            name: Script name (no .cs extension).\n            path: Asset path (default: \"Assets/\").\n            contents: C# code for 'create'/'update'.\n            script_type: Type hint (e.g., 'MonoBehaviour').\n            namespace: Script namespace.\n\n        Returns:\n            Dictionary with results ('success', 'message', 'data').\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "action": {"title": "Action", "type": "string"},
-                    "name": {"title": "Name", "type": "string"},
-                    "path": {"title": "Path", "type": "string"},
-                    "contents": {"title": "Contents", "type": "string"},
-                    "script_type": {"title": "Script Type", "type": "string"},
-                    "namespace": {"title": "Namespace", "type": "string"}
-                }
-            }
-        },
-        {
-            "uri": "manage_editor",
-            "description": "Controls and queries the Unity editor's state and settings.\n\n        Args:\n            action: Operation (e.g., 'play', 'pause', 'get_state', 'set_active_tool', 'add_tag').\n            wait_for_completion: Optional. If True, waits for certain actions.\n            Action-specific arguments (e.g., tool_name, tag_name, layer_name).\n\n        Returns:\n            Dictionary with operation results ('success', 'message', 'data').\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "action": {"title": "Action", "type": "string"},
-                    "wait_for_completion": {"title": "Wait For Completion", "type": "boolean"},
-                    "tool_name": {"title": "Tool Name", "type": "string"},
-                    "tag_name": {"title": "Tag Name", "type": "string"},
-                    "layer_name": {"title": "Layer Name", "type": "string"}
-                }
-            }
-        },
-        {
-            "uri": "manage_scene",
-            "description": "Manages Unity scenes (load, save, create, get hierarchy, etc.).\n\n        Args:\n            action: Operation (e.g., 'load', 'save', 'create', 'get_hierarchy').\n            name: Scene name (no extension) for create/load/save.\n            path: Asset path for scene operations (default: \"Assets/\").\n            build_index: Build index for load/build settings actions.\n            # Add other action-specific args as needed (e.g., for hierarchy depth)\n\n        Returns:\n            Dictionary with results ('success', 'message', 'data').\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "action": {"title": "Action", "type": "string"},
-                    "name": {"title": "Name", "type": "string"},
-                    "path": {"title": "Path", "type": "string"},
-                    "build_index": {"title": "Build Index", "type": "integer"}
-                }
-            }
-        },
-        {
-            "uri": "manage_asset",
-            "description": "Performs asset operations (import, create, modify, delete, etc.) in Unity.\n\n        Args:\n            ctx: The MCP context.\n            action: Operation to perform (e.g., 'import', 'create', 'modify', 'delete', 'duplicate', 'move', 'rename', 'search', 'get_info', 'create_folder', 'get_components').\n            path: Asset path (e.g., \"Materials/MyMaterial.mat\") or search scope.\n            asset_type: Asset type (e.g., 'Material', 'Folder') - required for 'create'.\n            properties: Dictionary of properties for 'create'/'modify'.\n            destination: Target path for 'duplicate'/'move'.\n            search_pattern: Search pattern (e.g., '*.prefab').\n            filter_*: Filters for search (type, date).\n            page_*: Pagination for search.\n\n        Returns:\n            A dictionary with operation results ('success', 'data', 'error').\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "action": {"title": "Action", "type": "string"},
-                    "path": {"title": "Path", "type": "string"},
-                    "asset_type": {"title": "Asset Type", "type": "string"},
-                    "properties": {"title": "Properties", "type": "object"},
-                    "destination": {"title": "Destination", "type": "string"},
-                    "search_pattern": {"title": "Search Pattern", "type": "string"},
-                    "filter_type": {"title": "Filter Type", "type": "string"},
-                    "filter_date_after": {"title": "Filter Date After", "type": "string"},
-                    "page_number": {"title": "Page Number", "type": "integer"},
-                    "page_size": {"title": "Page Size", "type": "integer"},
-                    "generate_preview": {"title": "Generate Preview", "type": "boolean", "default": False}
-                }
-            }
-        },
-        {
-            "uri": "manage_gameobject",
-            "description": "Manages GameObjects: create, modify, delete, find, and component operations.\n\n        Args:\n            action: Operation (e.g., 'create', 'modify', 'find', 'add_component', 'remove_component', 'set_component_property').\n            target: GameObject identifier (name or path string) for modify/delete/component actions.\n            search_method: How to find objects ('by_name', 'by_id', 'by_path', etc.). Used with 'find' and some 'target' lookups.\n            name: GameObject name - used for both 'create' (initial name) and 'modify' (rename).\n            tag: Tag name - used for both 'create' (initial tag) and 'modify' (change tag).\n            parent: Parent GameObject reference - used for both 'create' (initial parent) and 'modify' (change parent).\n            layer: Layer name - used for both 'create' (initial layer) and 'modify' (change layer).\n            component_properties: Dict mapping Component names to their properties to set.\n                                  Example: {\"Rigidbody\": {\"mass\": 10.0, \"useGravity\": True}},\n                                  To set references:\n                                  - Use asset path string for Prefabs/Materials, e.g., {\"MeshRenderer\": {\"material\": \"Assets/Materials/MyMat.mat\"}}\n                                  - Use a dict for scene objects/components, e.g.:\n                                    {\"MyScript\": {\"otherObject\": {\"find\": \"Player\", \"method\": \"by_name\"}}} (assigns GameObject)\n                                    {\"MyScript\": {\"playerHealth\": {\"find\": \"Player\", \"component\": \"HealthComponent\"}}} (assigns Component)\n                                  Example set nested property:\n                                  - Access shared material: {\"MeshRenderer\": {\"sharedMaterial.color\": [1, 0, 0, 1]}}\n            components_to_add: List of component names to add.\n            Action-specific arguments (e.g., position, rotation, scale for create/modify;\n                     component_name for component actions;\n                     search_term, find_all for 'find').\n\n        Returns:\n            Dictionary with operation results ('success', 'message', 'data').\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "action": {"title": "Action", "type": "string"},
-                    "target": {"title": "Target", "type": "string"},
-                    "search_method": {"title": "Search Method", "type": "string"},
-                    "name": {"title": "Name", "type": "string"},
-                    "tag": {"title": "Tag", "type": "string"},
-                    "parent": {"title": "Parent", "type": "string"},
-                    "layer": {"title": "Layer", "type": "string"},
-                    "position": {"title": "Position", "type": "array", "items": {"type": "number"}},
-                    "rotation": {"title": "Rotation", "type": "array", "items": {"type": "number"}},
-                    "scale": {"title": "Scale", "type": "array", "items": {"type": "number"}},
-                    "component_name": {"title": "Component Name", "type": "string"},
-                    "component_properties": {"title": "Component Properties", "type": "object", "additionalProperties": {"type": "object"}},
-                    "components_to_add": {"title": "Components To Add", "type": "array", "items": {"type": "string"}},
-                    "components_to_remove": {"title": "Components To Remove", "type": "array", "items": {"type": "string"}},
-                    "search_term": {"title": "Search Term", "type": "string"},
-                    "search_in_children": {"title": "Search In Children", "type": "boolean", "default": False},
-                    "search_inactive": {"title": "Search Inactive", "type": "boolean", "default": False},
-                    "find_all": {"title": "Find All", "type": "boolean", "default": False},
-                    "set_active": {"title": "Set Active", "type": "boolean"},
-                    "primitive_type": {"title": "Primitive Type", "type": "string"},
-                    "prefab_path": {"title": "Prefab Path", "type": "string"},
-                    "save_as_prefab": {"title": "Save As Prefab", "type": "boolean", "default": False},
-                    "prefab_folder": {"title": "Prefab Folder", "type": "string", "default": "Assets/Prefabs"}
-                }
-            }
-        },
-        {
-            "uri": "read_console",
-            "description": "Gets messages from or clears the Unity Editor console.\n\n        Args:\n            ctx: The MCP context.\n            action: Operation ('get' or 'clear').\n            types: Message types to get ('error', 'warning', 'log', 'all').\n            count: Max messages to return.\n            filter_text: Text filter for messages.\n            since_timestamp: Get messages after this timestamp (ISO 8601).\n            format: Output format ('plain', 'detailed', 'json').\n            include_stacktrace: Include stack traces in output.\n\n        Returns:\n            Dictionary with results. For 'get', includes 'data' (messages).\n        ",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "action": {"title": "Action", "type": "string"},
-                    "types": {"title": "Types", "type": "array", "items": {"type": "string"}},
-                    "count": {"title": "Count", "type": "integer"},
-                    "filter_text": {"title": "Filter Text", "type": "string"},
-                    "since_timestamp": {"title": "Since Timestamp", "type": "string"},
-                    "format": {"title": "Format", "type": "string"},
-                    "include_stacktrace": {"title": "Include Stacktrace", "type": "boolean"}
-                }
-            }
-        }
-    ]
-    
-    return ResourceListResponse(resources=resources, cursor=None)
+    return Response(content=_LIST_BYTES, media_type="application/json")
 
-@app.post("/read")
-async def read_resource(request: ResourceReadRequest) -> ResourceReadResponse:
+async def read_resource(request: Request) -> Response:
     """Read a resource's schema"""
+    uri = decode_body(await request.body(), ResourceReadRequest).uri
     # This is a simplified version that just returns the schema
     # In a real implementation, you would have more logic here
-    return ResourceReadResponse(content={"message": f"Schema for {request.uri}"})
-
-@app.post("/execute_menu_item")
-async def execute_menu_item(request: ExecuteMenuItemRequest) -> FunctionResponse:
-    """Execute a Unity Editor menu item"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "execute_menu_item",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error executing menu item: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+    content = _READ_BYTES.get(uri)
+    if content is None:
+        content = _encode_read_response(uri)
+    return Response(content=content, media_type="application/json")
 
-@app.post("/manage_script")
-async def manage_script(request: ManageScriptRequest) -> FunctionResponse:
-    """Manage C# scripts in Unity"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "manage_script",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error managing script: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+def make_handler(function_name: str, model: type) -> Callable:
+    """Build the endpoint that validates a request and forwards it to Unity"""
+    async def handler(request: Request) -> Response:
+        body = await request.body()
+        # Validate only; the body is forwarded to Unity exactly as received
+        decode_body(body, model)
+        
+        try:
+            # Unity's response is passed back to the caller as-is
+            content = await manager.forward_to_unity(function_name, body)
+        except Exception as e:
+            logger.error(f"Error calling {function_name}: {str(e)}")
+            content = orjson.dumps({"success": False, "error": str(e)})
+        return Response(content=content, media_type="application/json")
+    
+    handler.__name__ = function_name
+    handler.__doc__ = _DESCRIPTIONS[function_name]
+    return handler
 
-@app.post("/manage_editor")
-async def manage_editor(request: ManageEditorRequest) -> FunctionResponse:
-    """Control and query the Unity editor's state and settings"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "manage_editor",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error managing editor: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+app.add_route("/list", list_resources, methods=["POST"])
+app.add_route("/read", read_resource, methods=["POST"])
+for function_name, model in ROUTES.items():
+    app.add_route(f"/{function_name}", make_handler(function_name, model), methods=["POST"])
 
-@app.post("/manage_scene")
-async def manage_scene(request: ManageSceneRequest) -> FunctionResponse:
-    """Manage Unity scenes"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "manage_scene",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error managing scene: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+# WebSocket framing helpers
+async def receive_frame(websocket: WebSocket) -> Frame:
+    """Receive one raw message, sent as either a text or a binary frame"""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    data = message.get("bytes")
+    if data is None:
+        data = message["text"]
+    return data
 
-@app.post("/manage_asset")
-async def manage_asset(request: ManageAssetRequest) -> FunctionResponse:
-    """Perform asset operations in Unity"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "manage_asset",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error managing asset: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+async def receive_message(websocket: WebSocket) -> Dict[str, Any]:
+    """Receive and decode one JSON message"""
+    return orjson.loads(await receive_frame(websocket))
 
-@app.post("/manage_gameobject")
-async def manage_gameobject(request: ManageGameObjectRequest) -> FunctionResponse:
-    """Manage GameObjects in Unity"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "manage_gameobject",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error managing GameObject: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+async def send_frame(websocket: WebSocket, frame: Frame):
+    """Send a raw message, keeping its frame type"""
+    if isinstance(frame, str):
+        await websocket.send_text(frame)
+    else:
+        await websocket.send_bytes(frame)
 
-@app.post("/read_console")
-async def read_console(request: ReadConsoleRequest) -> FunctionResponse:
-    """Get messages from or clear the Unity Editor console"""
-    try:
-        response = await manager.send_to_unity({
-            "function": "read_console",
-            "params": request.dict()
-        })
-        return FunctionResponse(**response)
-    except Exception as e:
-        logger.error(f"Error reading console: {str(e)}")
-        return FunctionResponse(success=False, error=str(e))
+async def send_message(websocket: WebSocket, message: Dict[str, Any]):
+    """Send one JSON message to an MCP client as a text frame"""
+    await websocket.send_text(orjson.dumps(message).decode())
 
 # WebSocket endpoint for Unity and MCP clients
 @app.websocket("/ws")
@@ -435,27 +396,26 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.accept()
         
         # Get the client type from the first message
-        first_message = await websocket.receive_json()
+        first_message = await receive_message(websocket)
         client_type = first_message.get("client_type", "unknown")
         
         # Connect to the manager
-        await manager.connect(websocket, client_type)
+        manager.connect(websocket, client_type)
         
         # Handle messages
         while True:
-            message = await websocket.receive_json()
-            
             if client_type == "unity":
                 # Handle responses from Unity
-                manager.handle_unity_response(message)
+                manager.handle_unity_response(await receive_frame(websocket))
             else:
                 # Handle requests from MCP clients
+                message = await receive_message(websocket)
                 try:
                     function_name = message.get("function")
                     params = message.get("params", {})
                     
                     if not function_name:
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "id": message.get("id"),
                             "success": False,
                             "error": "Missing function name"
@@ -464,11 +424,11 @@ async def websocket_endpoint(websocket: WebSocket):
                     
                     # Forward the request to Unity
                     response = await manager.send_to_unity(message)
-                    await websocket.send_json(response)
+                    await send_frame(websocket, response)
                     
                 except Exception as e:
                     logger.error(f"Error handling client request: {str(e)}")
-                    await websocket.send_json({
+                    await send_message(websocket, {
                         "id": message.get("id"),
                         "success": False,
                         "error": str(e)
@@ -484,6 +444,42 @@ async def websocket_endpoint(websocket: WebSocket):
         except:
             pass
 
+def create_listen_socket(host: str, port: int, reuse_port: bool = False) -> socket.socket:
+    """Bind the server socket, optionally shared with other processes via SO_REUSEPORT"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # On Windows SO_REUSEADDR lets another process bind the same port, so it
+    # is only set on POSIX (as asyncio's create_server does)
+    if os.name == "posix":
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        else:
+            logger.warning("SO_REUSEPORT is not supported on this platform")
+    sock.bind((host, port))
+    return sock
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run("server:app", host="0.0.0.0", port=port, reload=True)
+    reuse_port = os.environ.get("REUSE_PORT", "").lower() in ("1", "true", "yes")
+    # The Unity connection and its pending requests live in this process, so the
+    # server always runs a single worker. REUSE_PORT lets a replacement instance
+    # bind the port before this one exits.
+    config = uvicorn.Config(
+        app,
+        # uvloop when installed (uvicorn[standard], except on Windows), else asyncio
+        loop="auto",
+        http="httptools",
+        ws="websockets",
+        workers=1,
+        # Cap message size and detect dead peers with pings, so a vanished
+        # editor is noticed before its pending requests time out
+        ws_max_size=16 * 1024 * 1024,
+        ws_ping_interval=20.0,
+        ws_ping_timeout=20.0,
+        timeout_keep_alive=15,
+        limit_concurrency=4096,
+        backlog=4096,
+    )
+    sock = create_listen_socket("0.0.0.0", port, reuse_port)
+    uvicorn.Server(config).run(sockets=[sock])
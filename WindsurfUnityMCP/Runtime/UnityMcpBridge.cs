@@ -270,7 +270,9 @@ namespace Windsurf.UnityMcp
                 
                 // Get the function name and parameters
                 string function = message["function"]?.ToString();
-                string id = message["id"]?.ToString();
+                // Keep the id token as sent so numeric ids are echoed back as numbers
+                JToken idToken = message["id"];
+                string id = idToken?.ToString();
                 
                 if (string.IsNullOrEmpty(function) || string.IsNullOrEmpty(id))
                 {
@@ -287,7 +289,7 @@ namespace Windsurf.UnityMcp
                         JObject result = await handler(message["params"] as JObject);
                         
                         // Add the id to the result
-                        result["id"] = id;
+                        result["id"] = idToken;
                         
                         // Send the result back to the server
                         await SendMessageAsync(result);
@@ -297,7 +299,7 @@ namespace Windsurf.UnityMcp
                         // Send error response
                         JObject errorResponse = new JObject
                         {
-                            ["id"] = id,
+                            ["id"] = idToken,
                             ["success"] = false,
                             ["error"] = ex.Message
                         };
@@ -310,7 +312,7 @@ namespace Windsurf.UnityMcp
                     // Unknown function
                     JObject errorResponse = new JObject
                     {
-                        ["id"] = id,
+                        ["id"] = idToken,
                         ["success"] = false,
                         ["error"] = $"Unknown function: {function}"
                     };
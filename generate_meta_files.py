@@ -5,82 +5,78 @@ This script creates basic meta files for all assets in the WindsurfUnityMCP dire
 """
 
 import os
-import uuid
 import time
+import binascii
+from concurrent.futures import ThreadPoolExecutor
 
 # Base directory for the Unity package
 base_dir = "WindsurfUnityMCP"
 
+# Meta file templates; {guid} is substituted with bytes.replace
 # Meta file template for folders
-folder_meta_template = """fileFormatVersion: 2
+folder_meta_template = b"""fileFormatVersion: 2
 guid: {guid}
 folderAsset: yes
 DefaultImporter:
-  externalObjects: {{}}
+  externalObjects: {}
   userData: 
   assetBundleName: 
   assetBundleVariant: 
 """
 
 # Meta file template for C# scripts
-cs_meta_template = """fileFormatVersion: 2
+cs_meta_template = b"""fileFormatVersion: 2
 guid: {guid}
 MonoImporter:
-  externalObjects: {{}}
+  externalObjects: {}
   serializedVersion: 2
   defaultReferences: []
   executionOrder: 0
-  icon: {{instanceID: 0}}
+  icon: {instanceID: 0}
   userData: 
   assetBundleName: 
   assetBundleVariant: 
 """
 
 # Meta file template for assembly definition files
-asmdef_meta_template = """fileFormatVersion: 2
+asmdef_meta_template = b"""fileFormatVersion: 2
 guid: {guid}
 AssemblyDefinitionImporter:
-  externalObjects: {{}}
+  externalObjects: {}
   userData: 
   assetBundleName: 
   assetBundleVariant: 
 """
 
 # Meta file template for text files (README, etc.)
-text_meta_template = """fileFormatVersion: 2
+text_meta_template = b"""fileFormatVersion: 2
 guid: {guid}
 TextScriptImporter:
-  externalObjects: {{}}
+  externalObjects: {}
   userData: 
   assetBundleName: 
   assetBundleVariant: 
 """
 
 # Meta file template for package.json
-package_meta_template = """fileFormatVersion: 2
+package_meta_template = b"""fileFormatVersion: 2
 guid: {guid}
 PackageManifestImporter:
-  externalObjects: {{}}
+  externalObjects: {}
   userData: 
   assetBundleName: 
   assetBundleVariant: 
 """
 
-def generate_guid():
-    """Generate a Unity-compatible GUID"""
-    return str(uuid.uuid4()).replace("-", "")
+def generate_guids(count):
+    """Generate Unity-compatible GUIDs (32 hex digits) from a single urandom call"""
+    digits = binascii.hexlify(os.urandom(16 * count))
+    return [digits[i:i + 32] for i in range(0, len(digits), 32)]
 
-def create_meta_file(path, is_folder=False):
-    """Create a meta file for the given path"""
+def create_meta_file(path, guid, is_folder=False):
+    """Create a meta file for the given path and return a status message"""
     meta_path = path + ".meta"
     
-    # Skip if meta file already exists
-    if os.path.exists(meta_path):
-        print(f"Meta file already exists: {meta_path}")
-        return
-    
-    guid = generate_guid()
-    
     if is_folder:
         template = folder_meta_template
     elif path.endswith(".cs"):
@@ -94,28 +90,49 @@ def create_meta_file(path, is_folder=False):
     else:
         template = text_meta_template  # Default to text importer
     
-    with open(meta_path, "w") as f:
-        f.write(template.format(guid=guid))
+    # O_EXCL checks for an existing meta file and creates it in one call
+    try:
+        fd = os.open(meta_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return f"Meta file already exists: {meta_path}"
+    
+    try:
+        os.write(fd, template.replace(b"{guid}", guid))
+    finally:
+        os.close(fd)
+    
+    return f"Created meta file: {meta_path}"
+
+def collect_assets(directory, assets):
+    """Collect (path, is_folder) for a directory and all assets below it"""
+    # Include the directory itself
+    assets.append((directory, True))
+    
+    # Process all files and subdirectories; scandir reports the entry
+    # type along with the name, so no separate stat is needed per entry
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Skip hidden files and meta files
+            if entry.name.startswith(".") or entry.name.endswith(".meta"):
+                continue
+            
+            if entry.is_dir():
+                collect_assets(entry.path, assets)
+            else:
+                assets.append((entry.path, False))
     
-    print(f"Created meta file: {meta_path}")
+    return assets
 
 def process_directory(directory):
     """Process a directory and create meta files for all assets"""
-    # Create meta file for the directory itself
-    create_meta_file(directory, is_folder=True)
+    paths, folders = zip(*collect_assets(directory, []))
+    guids = generate_guids(len(paths))
     
-    # Process all files and subdirectories
-    for item in os.listdir(directory):
-        path = os.path.join(directory, item)
-        
-        # Skip hidden files and meta files
-        if item.startswith(".") or item.endswith(".meta"):
-            continue
-        
-        if os.path.isdir(path):
-            process_directory(path)
-        else:
-            create_meta_file(path)
+    # Each meta file is independent, so the writes are spread over a thread
+    # pool to overlap their file system latency; messages print in walk order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for message in executor.map(create_meta_file, paths, guids, folders):
+            print(message)
 
 if __name__ == "__main__":
     if os.path.exists(base_dir):
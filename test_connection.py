@@ -4,62 +4,163 @@ Windsurf Unity MCP Connection Test Script
 This script tests the connection to the Windsurf Unity MCP server and verifies that it's working correctly.
 """
 
+import argparse
 import asyncio
-import json
+import contextlib
+import io
+import socket
 import sys
+from typing import Any, Dict, Optional
+
+import msgspec
 import websockets
 
 SERVER_URL = "ws://localhost:8000/ws"
+CONNECT_TIMEOUT = 5.0  # seconds to wait for the WebSocket handshake
+RESPONSE_TIMEOUT = 5.0  # seconds to wait for each reply from Unity
+
+# Wire messages
+class Hello(msgspec.Struct):
+    client_type: str
+    client_name: str
+
+class Request(msgspec.Struct):
+    id: str
+    function: str
+    params: Dict[str, Any]
+
+class Response(msgspec.Struct):
+    # Only the fields the test checks; the rest is printed from the raw message
+    success: bool = False
+    error: Optional[str] = None
+
+# Reads only the Response fields; nested editor state is skipped, not built
+RESPONSE_DECODER = msgspec.json.Decoder(Response)
+
+# The messages never change, so they are encoded once at import. The request
+# is split at its id's placeholder ("id" is encoded first, so the first "#" is
+# the placeholder) and each probe only splices in its number.
+HELLO_BYTES = msgspec.json.encode(Hello("mcp_client", "Windsurf_Test"))
+REQUEST_PREFIX, REQUEST_SUFFIX = msgspec.json.encode(Request(
+    id="test_request_#",
+    function="manage_editor",
+    params={"action": "get_state"}
+)).split(b"#", 1)
+
+@contextlib.contextmanager
+def corked(websocket):
+    """Hold back partial TCP segments until the block exits (Linux TCP_CORK)"""
+    sock = websocket.transport.get_extra_info("socket")
+    cork = getattr(socket, "TCP_CORK", None)
+    if sock is None or cork is None:
+        yield
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, cork, 1)
+    try:
+        yield
+    finally:
+        sock.setsockopt(socket.IPPROTO_TCP, cork, 0)
 
-async def test_connection():
+async def test_connection(verbose=False, repeat=1):
     """Test the connection to the Windsurf Unity MCP server."""
-    print(f"Connecting to Windsurf Unity MCP server at {SERVER_URL}...")
+    # Output is collected and written to stdout once, when the test is over
+    out = io.StringIO()
+    print(f"Connecting to Windsurf Unity MCP server at {SERVER_URL}...", file=out)
     
     try:
-        async with websockets.connect(SERVER_URL) as websocket:
-            # Send initial message to identify as a test client
-            await websocket.send(json.dumps({
-                "client_type": "mcp_client",
-                "client_name": "Windsurf_Test"
-            }))
-            
-            print("Connected successfully! ✅")
-            print("Sending test request to get editor state...")
+        # A one-shot probe needs no compression for its tiny frames, no
+        # keep-alive pings and no size cap on the editor state it reads back
+        try:
+            websocket = await websockets.connect(
+                SERVER_URL,
+                compression=None,
+                ping_interval=None,
+                ping_timeout=None,
+                max_size=None,
+                open_timeout=CONNECT_TIMEOUT,
+                close_timeout=0
+            )
+        except TimeoutError:
+            # Reported here so the reply timeout below is not blamed for it
+            print(f"No handshake within {CONNECT_TIMEOUT:g} seconds! ❌", file=out)
+            print("Make sure the Unity Windsurf MCP server is running and accessible.", file=out)
+            return
+        try:
+            print("Connected successfully! ✅", file=out)
+            print(f"Sending {repeat} test request(s) to get editor state...", file=out)
             
-            # Send a request to get the editor state
-            await websocket.send(json.dumps({
-                "id": "test_request",
-                "function": "manage_editor",
-                "params": {
-                    "action": "get_state"
-                }
-            }))
+            # Requests to get the editor state; all of them share this connection
+            requests = [REQUEST_PREFIX + b"%d" % i + REQUEST_SUFFIX for i in range(1, repeat + 1)]
             
-            # Wait for the response
-            response = await websocket.recv()
-            response_data = json.loads(response)
+            # Send the identification and the requests back to back so the
+            # frames leave together instead of one TCP segment each
+            with corked(websocket):
+                # Send initial message to identify as a test client
+                await websocket.send(HELLO_BYTES)
+                for request in requests:
+                    await websocket.send(request)
             
-            print("\nResponse from Unity:")
-            print(json.dumps(response_data, indent=2))
+            # The server answers a client's requests in the order they were sent
+            failures = []
+            for _ in requests:
+                # Raw bytes go straight to the decoder without a UTF-8 decode first
+                response = await asyncio.wait_for(websocket.recv(decode=False), timeout=RESPONSE_TIMEOUT)
+                response_data = RESPONSE_DECODER.decode(response)
+                if not response_data.success:
+                    failures.append(response_data)
+                
+                if verbose:
+                    print("\nResponse from Unity:", file=out)
+                    print(msgspec.json.format(response, indent=2).decode(), file=out)
             
-            if response_data.get("success"):
-                print("\nTest completed successfully! ✅")
-                print("The Windsurf Unity MCP system is working correctly.")
+            if not failures:
+                print("\nTest completed successfully! ✅", file=out)
+                print("The Windsurf Unity MCP system is working correctly.", file=out)
             else:
-                print("\nTest failed! ❌")
-                print(f"Error: {response_data.get('error', 'Unknown error')}")
-                print("Make sure Unity is running with the Windsurf Unity MCP package installed.")
+                print("\nTest failed! ❌", file=out)
+                print(f"{len(failures)} of {repeat} request(s) failed", file=out)
+                print(f"Error: {failures[0].error or 'Unknown error'}", file=out)
+                print("Make sure Unity is running with the Windsurf Unity MCP package installed.", file=out)
+        finally:
+            # Drop the connection without waiting on the closing handshake
+            websocket.transport.abort()
                 
     except ConnectionRefusedError:
-        print("Connection refused! ❌")
-        print("Make sure the Unity Windsurf MCP server is running on port 8000.")
+        print("Connection refused! ❌", file=out)
+        print("Make sure the Unity Windsurf MCP server is running on port 8000.", file=out)
+    except asyncio.TimeoutError:
+        print(f"No response within {RESPONSE_TIMEOUT:g} seconds! ❌", file=out)
+        print("Make sure Unity is running with the Windsurf Unity MCP package installed.", file=out)
     except Exception as e:
-        print(f"Error: {str(e)} ❌")
-        print("Make sure the Unity Windsurf MCP server is running and accessible.")
+        print(f"Error: {str(e)} ❌", file=out)
+        print("Make sure the Unity Windsurf MCP server is running and accessible.", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
+
+def positive_int(value):
+    """argparse type for a count of at least one"""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
+
+def run(main):
+    """Run a coroutine on uvloop when it is installed, otherwise on asyncio"""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional and has no Windows build
+        return asyncio.run(main)
+    return uvloop.run(main)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test the connection to the Windsurf Unity MCP server.")
+    parser.add_argument("--verbose", action="store_true", help="print the full response from Unity")
+    parser.add_argument("--repeat", type=positive_int, default=1, help="number of requests to send over one connection")
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(test_connection())
+        run(test_connection(verbose=args.verbose, repeat=args.repeat))
     except KeyboardInterrupt:
         print("\nTest interrupted by user.")
         sys.exit(0)